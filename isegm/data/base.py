@@ -57,8 +57,9 @@ class ISDataset(torch.utils.data.dataset.Dataset):
 
     def __getitem__(self, index):
         if self.samples_precomputed_scores is not None:
-            index = np.random.choice(self.samples_precomputed_scores['indices'],
-                                     p=self.samples_precomputed_scores['probs'])
+            scores_cdf = self.samples_precomputed_scores['cdf']
+            score_index = np.searchsorted(scores_cdf, np.random.random(), side='right')
+            index = self.samples_precomputed_scores['indices'][min(score_index, len(scores_cdf) - 1)]
         else:
             if self.epoch_len > 0:
                 index = random.randrange(0, len(self.dataset_samples))
@@ -93,7 +94,7 @@ class ISDataset(torch.utils.data.dataset.Dataset):
 
         output = {
             'images': image,
-            'points': points.astype(np.float32),
+            'points': points,
             'instances': masks
         }
 
@@ -174,9 +175,10 @@ class ISDataset(torch.utils.data.dataset.Dataset):
         if self.min_object_area <= 0:
             return sample
 
+        obj_sizes = np.bincount(sample['instances_mask'].ravel())
         for obj_id, obj_info in sample['instances_info'].items():
             if not obj_info['ignore']:
-                obj_area = (sample['instances_mask'] == obj_id).sum()
+                obj_area = obj_sizes[obj_id] if obj_id < len(obj_sizes) else 0
                 if obj_area < self.min_object_area:
                     obj_info['ignore'] = True
 
@@ -192,9 +194,11 @@ class ISDataset(torch.utils.data.dataset.Dataset):
 
         probs = np.array([(1.0 - x[2]) ** samples_scores_gamma for x in images_scores])
         probs /= probs.sum()
+        cdf = np.cumsum(probs)
+        cdf /= cdf[-1]
         samples_scores = {
             'indices': [x[0] for x in images_scores],
-            'probs': probs
+            'cdf': cdf
         }
         print(f'Loaded {len(probs)} weights with gamma={samples_scores_gamma}')
         return samples_scores
@@ -85,6 +85,7 @@ class MultiPointSampler(BasePointSampler):
         self._pos_probs = self._generate_probs(max_num_points, gamma=prob_gamma)
         self._neg_probs = self._generate_probs(max_num_points + 1, gamma=prob_gamma)
         self._neg_indices = None
+        self._neg_masks = None
 
     def sample_object(self, dataset_sample):
         if len(dataset_sample['objects_ids']) == 0:
@@ -92,6 +93,7 @@ class MultiPointSampler(BasePointSampler):
             self._selected_indices = [[]]
             bg_indices = np.argwhere(dataset_sample['instances_mask'] == 0)
             self._neg_indices = {strategy: bg_indices for strategy in self.neg_strategies}
+            self._neg_masks = None
             return
 
         if len(dataset_sample['objects_ids']) > 1 and random.random() < self.merge_objects_prob:
@@ -110,19 +112,11 @@ class MultiPointSampler(BasePointSampler):
             self._selected_indices = [np.argwhere(self._positive_erode(mask))]
 
         self.selected_mask = mask
-        neg_indices_bg = np.argwhere(np.logical_not(mask))
-        neg_indices_border = np.argwhere(self._get_border_mask(mask))
-        if len(dataset_sample['objects_ids']) <= len(self._selected_indices):
-            neg_indices_other = neg_indices_bg
-        else:
-            other_objects_mask = np.logical_and(dataset_sample['instances_mask'] > 0,
-                                                np.logical_not(mask))
-            neg_indices_other = np.argwhere(other_objects_mask)
-
-        self._neg_indices = {
-            'bg': neg_indices_bg,
-            'other': neg_indices_other,
-            'border': neg_indices_border
+        self._neg_indices = dict()
+        self._neg_masks = {
+            'mask': mask,
+            'instances_mask': dataset_sample['instances_mask'],
+            'with_other_objects': len(dataset_sample['objects_ids']) > len(self._selected_indices)
         }
 
     def sample_points(self):
@@ -149,7 +143,7 @@ class MultiPointSampler(BasePointSampler):
                 pos_points.extend([(-1, -1)] * (self.max_num_points - len(pos_points)))
 
         negative_strategy = np.random.choice(self.neg_strategies, p=self.neg_strategies_prob)
-        neg_points = self._sample_points(self._neg_indices[negative_strategy], is_negative=True)
+        neg_points = self._sample_points(self._get_neg_indices(negative_strategy), is_negative=True)
 
         return pos_points + neg_points
 
@@ -167,6 +161,25 @@ class MultiPointSampler(BasePointSampler):
 
         return points
 
+    def _get_neg_indices(self, strategy):
+        if strategy in self._neg_indices:
+            return self._neg_indices[strategy]
+
+        mask = self._neg_masks['mask']
+        if strategy == 'border':
+            neg_indices = np.argwhere(self._get_border_mask(mask))
+        elif strategy == 'other' and self._neg_masks['with_other_objects']:
+            other_objects_mask = np.logical_and(self._neg_masks['instances_mask'] > 0,
+                                                np.logical_not(mask))
+            neg_indices = np.argwhere(other_objects_mask)
+        elif strategy == 'other':
+            neg_indices = self._get_neg_indices('bg')
+        else:
+            neg_indices = np.argwhere(np.logical_not(mask))
+
+        self._neg_indices[strategy] = neg_indices
+        return neg_indices
+
     def _positive_erode(self, mask):
         if random.random() > self.positive_erode_prob:
             return mask
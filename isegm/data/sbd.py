@@ -18,6 +18,7 @@ class SBDDataset(ISDataset):
         self.dataset_split = split
         self._images_path = self.dataset_path / 'img'
         self._insts_path = self.dataset_path / 'inst'
+        self._insts_cache_path = get_insts_cache_path(self.dataset_path)
         self._buggy_objects = dict()
         self._buggy_mask_thresh = buggy_mask_thresh
 
@@ -27,11 +28,10 @@ class SBDDataset(ISDataset):
     def get_sample(self, index):
         image_name = self.dataset_samples[index]
         image_path = str(self._images_path / f'{image_name}.jpg')
-        inst_info_path = str(self._insts_path / f'{image_name}.mat')
 
         image = cv2.imread(image_path)
         image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        instances_mask = loadmat(str(inst_info_path))['GTinst'][0][0][0].astype(np.int32)
+        instances_mask = load_instances_mask(self._insts_path, self._insts_cache_path, image_name)
         instances_mask = self.remove_buggy_masks(index, instances_mask)
         instances_ids = get_unique_labels(instances_mask, exclude_zero=True)
 
@@ -78,6 +78,7 @@ class SBDEvaluationDataset(ISDataset):
         self.dataset_split = split
         self._images_path = self.dataset_path / 'img'
         self._insts_path = self.dataset_path / 'inst'
+        self._insts_cache_path = get_insts_cache_path(self.dataset_path)
 
         with open(self.dataset_path / f'{split}.txt', 'r') as f:
             self.dataset_samples = [x.strip() for x in f.readlines()]
@@ -87,11 +88,10 @@ class SBDEvaluationDataset(ISDataset):
     def get_sample(self, index):
         image_name, instance_id = self.dataset_samples[index]
         image_path = str(self._images_path / f'{image_name}.jpg')
-        inst_info_path = str(self._insts_path / f'{image_name}.mat')
 
         image = cv2.imread(image_path)
         image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        instances_mask = loadmat(str(inst_info_path))['GTinst'][0][0][0].astype(np.int32)
+        instances_mask = load_instances_mask(self._insts_path, self._insts_cache_path, image_name)
         instances_mask[instances_mask != instance_id] = 0
         instances_mask[instances_mask > 0] = 1
 
@@ -118,8 +118,7 @@ class SBDEvaluationDataset(ISDataset):
             images_and_ids_list = []
 
             for sample in self.dataset_samples:
-                inst_info_path = str(self._insts_path / f'{sample}.mat')
-                instances_mask = loadmat(str(inst_info_path))['GTinst'][0][0][0].astype(np.int32)
+                instances_mask = load_instances_mask(self._insts_path, self._insts_cache_path, sample)
                 instances_ids = get_unique_labels(instances_mask, exclude_zero=True)
 
                 for instances_id in instances_ids:
@@ -129,3 +128,18 @@ class SBDEvaluationDataset(ISDataset):
                 pkl.dump(images_and_ids_list, fp)
 
         return images_and_ids_list
+
+
+def get_insts_cache_path(dataset_path):
+    insts_cache_path = Path(dataset_path) / 'inst_png'
+    return insts_cache_path if insts_cache_path.exists() else None
+
+
+def load_instances_mask(insts_path, insts_cache_path, image_name):
+    if insts_cache_path is not None:
+        instances_mask = cv2.imread(str(insts_cache_path / f'{image_name}.png'), cv2.IMREAD_UNCHANGED)
+        if instances_mask is not None:
+            return instances_mask.astype(np.int32)
+
+    inst_info_path = str(insts_path / f'{image_name}.mat')
+    return loadmat(inst_info_path)['GTinst'][0][0][0].astype(np.int32)
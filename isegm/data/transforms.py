@@ -0,0 +1,68 @@
+import random
+
+import cv2
+import numpy as np
+import torch
+from albumentations.core.transforms_interface import ImageOnlyTransform, to_tuple
+
+
+class BrightnessContrastRGBShift(ImageOnlyTransform):
+    """Fused RandomBrightnessContrast + RGBShift for uint8 images.
+
+    Both transforms are pointwise, so their composition is applied
+    as a single per-channel lookup table with one cv2.LUT call.
+    """
+    def __init__(self, brightness_limit=0.2, contrast_limit=0.2, brightness_contrast_p=0.5,
+                 r_shift_limit=20, g_shift_limit=20, b_shift_limit=20, rgb_shift_p=0.5,
+                 always_apply=False, p=1.0):
+        super().__init__(always_apply, p)
+        self.brightness_limit = to_tuple(brightness_limit)
+        self.contrast_limit = to_tuple(contrast_limit)
+        self.brightness_contrast_p = brightness_contrast_p
+        self.r_shift_limit = to_tuple(r_shift_limit)
+        self.g_shift_limit = to_tuple(g_shift_limit)
+        self.b_shift_limit = to_tuple(b_shift_limit)
+        self.rgb_shift_p = rgb_shift_p
+
+    def apply(self, image, alpha=1.0, beta=0.0, shifts=(0, 0, 0), **params):
+        assert image.dtype == np.uint8 and image.ndim == 3 and image.shape[2] == 3
+
+        lut = np.arange(256, dtype=np.float32) * alpha + beta * 255
+        lut = np.floor(np.clip(lut, 0, 255))
+        lut = np.stack([lut + shift for shift in shifts], axis=1)
+        lut = np.clip(lut, 0, 255).astype(np.uint8)
+
+        return cv2.LUT(image, lut.reshape(256, 1, 3))
+
+    def get_params(self):
+        params = {}
+        if random.random() < self.brightness_contrast_p:
+            params['alpha'] = 1.0 + random.uniform(*self.contrast_limit)
+            params['beta'] = random.uniform(*self.brightness_limit)
+        if random.random() < self.rgb_shift_p:
+            params['shifts'] = (random.uniform(*self.r_shift_limit),
+                                random.uniform(*self.g_shift_limit),
+                                random.uniform(*self.b_shift_limit))
+        return params
+
+    def get_transform_init_args_names(self):
+        return ('brightness_limit', 'contrast_limit', 'brightness_contrast_p',
+                'r_shift_limit', 'g_shift_limit', 'b_shift_limit', 'rgb_shift_p')
+
+
+class FusedNormalize(object):
+    """ToTensor + Normalize for uint8 HWC images in a single float pass."""
+    def __init__(self, mean, std):
+        mean = np.array(mean, dtype=np.float32)
+        std = np.array(std, dtype=np.float32)
+        self.scale = (1.0 / (255 * std))[:, np.newaxis, np.newaxis]
+        self.offset = (mean / std)[:, np.newaxis, np.newaxis]
+
+    def __call__(self, image):
+        assert image.dtype == np.uint8 and image.ndim == 3
+
+        x = image.transpose((2, 0, 1)).astype(np.float32, order='C')
+        x *= self.scale
+        x -= self.offset
+
+        return torch.from_numpy(x)
@@ -1,5 +1,7 @@
 import os
+import time
 import logging
+import threading
 from copy import deepcopy
 from collections import defaultdict
 
@@ -13,6 +15,7 @@ from torchvision.transforms import Normalize
 from isegm.utils.log import logger, TqdmToLogger, SummaryWriterAvg
 from isegm.utils.vis import draw_probmap, draw_points
 from isegm.utils.misc import save_checkpoint
+from isegm.utils.prefetch import CUDAPrefetcher
 
 
 class ISTrainer(object):
@@ -48,22 +51,33 @@ class ISTrainer(object):
         self.image_dump_interval = image_dump_interval
         self.task_prefix = ''
         self.sw = None
+        self._warmup_done = False
+        self._checkpoint_thread = None
+        self._checkpoint_error = None
 
         self.trainset = trainset
         self.valset = valset
 
+        loader_params = {'num_workers': cfg.workers, 'pin_memory': True}
+        if cfg.workers > 0:
+            # Deeper prefetch queues do not speed up loading and only increase memory usage.
+            loader_params['prefetch_factor'] = 2
+
         self.train_data = DataLoader(
             trainset, cfg.batch_size, shuffle=True,
-            drop_last=True, pin_memory=True,
-            num_workers=cfg.workers
+            drop_last=True, persistent_workers=cfg.workers > 0,
+            **loader_params
         )
 
         self.val_data = DataLoader(
             valset, cfg.val_batch_size, shuffle=False,
-            drop_last=True, pin_memory=True,
-            num_workers=cfg.workers
+            drop_last=True, **loader_params
         )
 
+        if cfg.get('use_prefetch', True):
+            self.train_data = CUDAPrefetcher(self.train_data, cfg.device)
+            self.val_data = CUDAPrefetcher(self.val_data, cfg.device)
+
         backbone_params, other_params = model.get_trainable_params()
         opt_params = [
             {'params': backbone_params, 'lr': backbone_lr_mult * optimizer_params['lr']},
@@ -103,10 +117,39 @@ class ISTrainer(object):
 
         self._load_weights()
 
+    def run_warmup(self):
+        if self._warmup_done or self.device.type != 'cuda':
+            return
+        self._warmup_done = True
+
+        crop_height, crop_width = self.model_cfg.crop_size
+        num_points = 2 * max(1, self.max_interactive_points)
+        image = torch.zeros(self.cfg.batch_size, 3, crop_height, crop_width, device=self.device)
+        points = torch.full((self.cfg.batch_size, num_points, 2), -1,
+                            dtype=torch.float32, device=self.device)
+
+        buffers = {name: buffer.clone() for name, buffer in self.net.named_buffers()}
+
+        start_time = time.time()
+        self.net.train()
+        output = self.net(image, points)
+        sum(x.mean() for x in output.values()).backward()
+        torch.cuda.synchronize(self.device)
+        warmup_time = time.time() - start_time
+
+        self.optim.zero_grad()
+        with torch.no_grad():
+            for name, buffer in self.net.named_buffers():
+                buffer.copy_(buffers[name])
+
+        logger.info(f'Warmup forward/backward pass took {warmup_time:.1f}s')
+
     def training(self, epoch):
         if self.sw is None:
             self.sw = SummaryWriterAvg(log_dir=str(self.cfg.LOGS_PATH),
                                        flush_secs=10, dump_period=self.tb_dump_period)
+        self.run_warmup()
+        self.wait_for_checkpoints()
 
         log_prefix = 'Train' + self.task_prefix.capitalize()
         tbar = tqdm(self.train_data, file=self.tqdm_out, ncols=100)
@@ -157,11 +200,8 @@ class ISTrainer(object):
                                value=metric.get_epoch_value(),
                                global_step=epoch, disable_avg=True)
 
-        save_checkpoint(self.net, self.cfg.CHECKPOINTS_PATH, prefix=self.task_prefix,
-                        epoch=None, multi_gpu=self.cfg.multi_gpu)
-        if epoch % self.checkpoint_interval == 0:
-            save_checkpoint(self.net, self.cfg.CHECKPOINTS_PATH, prefix=self.task_prefix,
-                            epoch=epoch, multi_gpu=self.cfg.multi_gpu)
+        self._checkpoint_thread = threading.Thread(target=self._save_checkpoints, args=(epoch,))
+        self._checkpoint_thread.start()
 
         if self.lr_scheduler is not None:
             self.lr_scheduler.step()
@@ -208,6 +248,26 @@ class ISTrainer(object):
         self.sw.add_scalar(tag=f'{log_prefix}Losses/overall', value=val_loss / num_batches,
                            global_step=epoch, disable_avg=True)
 
+    def wait_for_checkpoints(self):
+        if self._checkpoint_thread is not None:
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+
+        if self._checkpoint_error is not None:
+            error, self._checkpoint_error = self._checkpoint_error, None
+            raise error
+
+    def _save_checkpoints(self, epoch):
+        try:
+            save_checkpoint(self.net, self.cfg.CHECKPOINTS_PATH, prefix=self.task_prefix,
+                            epoch=None, multi_gpu=self.cfg.multi_gpu)
+            if epoch % self.checkpoint_interval == 0:
+                save_checkpoint(self.net, self.cfg.CHECKPOINTS_PATH, prefix=self.task_prefix,
+                                epoch=epoch, multi_gpu=self.cfg.multi_gpu)
+        except Exception as e:
+            logger.exception(f'Failed to save checkpoint for epoch {epoch}')
+            self._checkpoint_error = e
+
     def batch_forward(self, batch_data, validation=False):
         if 'instances' in batch_data:
             batch_size, num_points, c, h, w = batch_data['instances'].size()
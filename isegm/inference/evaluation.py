@@ -19,13 +19,13 @@ def evaluate_dataset(dataset, predictor, oracle_eval=False, **kwargs):
     start_time = time()
     for index in tqdm(range(len(dataset)), leave=False):
         sample = dataset.get_sample(index)
-        item = dataset[index]
+        image_nd = dataset.input_transform(sample['image'])
 
         if oracle_eval:
             gt_mask = torch.tensor(sample['instances_mask'], dtype=torch.float32)
             gt_mask = gt_mask.unsqueeze(0).unsqueeze(0)
             predictor.opt_functor.mask_loss.set_gt_mask(gt_mask)
-        _, sample_ious, _ = evaluate_sample(item['images'], sample['instances_mask'], predictor, **kwargs)
+        _, sample_ious, _ = evaluate_sample(image_nd, sample['instances_mask'], predictor, **kwargs)
         all_ious.append(sample_ious)
     end_time = time()
     elapsed_time = end_time - start_time
@@ -4,6 +4,7 @@ from .zoom_in import ZoomIn, get_roi_image_nd
 class LimitLongestSide(ZoomIn):
     def __init__(self, max_size=800):
         super().__init__(target_size=max_size, skip_clicks=0)
+        self._input_image = None
 
     def transform(self, image_nd, clicks_lists):
         assert image_nd.shape[0] == 1 and len(clicks_lists) == 1
@@ -12,11 +13,21 @@ class LimitLongestSide(ZoomIn):
 
         if image_max_size <= self.target_size:
             return image_nd, clicks_lists
-        self._input_image = image_nd
 
-        self._object_roi = (0, image_nd.shape[2] - 1, 0, image_nd.shape[3] - 1)
-        self._roi_image = get_roi_image_nd(image_nd, self._object_roi, self.target_size)
+        if self._roi_image is None or self._input_image is not image_nd:
+            self._input_image = image_nd
+            self._object_roi = (0, image_nd.shape[2] - 1, 0, image_nd.shape[3] - 1)
+            self._roi_image = get_roi_image_nd(image_nd, self._object_roi, self.target_size)
+        self._roi_image = self._roi_image.to(image_nd.device)
         self.image_changed = True
 
         tclicks_lists = [self._transform_clicks(clicks_lists[0])]
         return self._roi_image, tclicks_lists
+
+    def set_state(self, state):
+        super().set_state(state)
+        self._input_image = None
+
+    def reset(self):
+        super().reset()
+        self._input_image = None
@@ -58,9 +58,10 @@ class ZoomIn(BaseTransform):
             self._object_roi = current_object_roi
             self._roi_image = get_roi_image_nd(image_nd, self._object_roi, self.target_size)
             self.image_changed = True
+        self._roi_image = self._roi_image.to(image_nd.device)
 
         tclicks_lists = [self._transform_clicks(clicks_list)]
-        return self._roi_image.to(image_nd.device), tclicks_lists
+        return self._roi_image, tclicks_lists
 
     def inv_transform(self, prob_map):
         if self._object_roi is None:
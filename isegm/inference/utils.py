@@ -24,7 +24,7 @@ def get_time_metrics(all_ious, elapsed_time):
 
 def load_is_model(checkpoint, device, backbone='auto', **kwargs):
     if isinstance(checkpoint, (str, Path)):
-        state_dict = torch.load(checkpoint, map_location='cpu')
+        state_dict = torch.load(checkpoint, map_location=device)
     else:
         state_dict = checkpoint
 
@@ -59,10 +59,10 @@ def load_hrnet_is_model(state_dict, device, backbone='auto', width=48, ocr_width
                             with_aux_output=False, cpu_dist_maps=cpu_dist_maps,
                             norm_radius=norm_radius)
 
+    model.to(device)
     model.load_state_dict(state_dict, strict=False)
     for param in model.parameters():
         param.requires_grad = False
-    model.to(device)
     model.eval()
 
     return model
@@ -95,10 +95,10 @@ def load_deeplab_is_model(state_dict, device, backbone='auto', deeplab_ch=128, a
                               aspp_dropout=aspp_dropout, cpu_dist_maps=cpu_dist_maps,
                               norm_radius=norm_radius)
 
+    model.to(device)
     model.load_state_dict(state_dict, strict=False)
     for param in model.parameters():
         param.requires_grad = False
-    model.to(device)
     model.eval()
 
     return model
@@ -134,15 +134,16 @@ def get_iou(gt_mask, pred_mask, ignore_label=-1):
 
 
 def compute_noc_metric(all_ious, iou_thrs, max_clicks=20):
-    def _get_noc(iou_arr, iou_thr):
-        vals = iou_arr >= iou_thr
-        return np.argmax(vals) + 1 if np.any(vals) else max_clicks
+    max_len = max(map(len, all_ious))
+    ious_arr = np.full((len(all_ious), max_len), -1, dtype=np.float32)
+    for i, iou_arr in enumerate(all_ious):
+        ious_arr[i, :len(iou_arr)] = iou_arr
 
     noc_list = []
     over_max_list = []
     for iou_thr in iou_thrs:
-        scores_arr = np.array([_get_noc(iou_arr, iou_thr)
-                               for iou_arr in all_ious], dtype=np.int)
+        vals = ious_arr >= iou_thr
+        scores_arr = np.where(vals.any(axis=1), vals.argmax(axis=1) + 1, max_clicks)
 
         score = scores_arr.mean()
         over_max = (scores_arr == max_clicks).sum()
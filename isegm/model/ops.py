@@ -42,6 +42,23 @@ class DistMaps(nn.Module):
         self.spatial_scale = spatial_scale
         self.norm_radius = norm_radius
         self.cpu_mode = cpu_mode
+        self._coords_grids = dict()
+
+    def get_coords_grid(self, rows, cols, device):
+        key = (device, rows, cols)
+        grid = self._coords_grids.get(key, None)
+        if grid is None:
+            row_array = torch.arange(start=0, end=rows, step=1, dtype=torch.float32, device=device)
+            col_array = torch.arange(start=0, end=cols, step=1, dtype=torch.float32, device=device)
+
+            coord_rows, coord_cols = torch.meshgrid(row_array, col_array)
+            grid = torch.stack((coord_rows, coord_cols), dim=0).unsqueeze(0)
+            # Inference with zoom-in produces many different input sizes, so keep the cache small.
+            if len(self._coords_grids) >= 16:
+                self._coords_grids.clear()
+            self._coords_grids[key] = grid
+
+        return grid
 
     def get_coord_features(self, points, batchsize, rows, cols):
         if self.cpu_mode:
@@ -55,14 +72,10 @@ class DistMaps(nn.Module):
             num_points = points.shape[1] // 2
             points = points.view(-1, 2)
             invalid_points = torch.max(points, dim=1, keepdim=False)[0] < 0
-            row_array = torch.arange(start=0, end=rows, step=1, dtype=torch.float32, device=points.device)
-            col_array = torch.arange(start=0, end=cols, step=1, dtype=torch.float32, device=points.device)
-
-            coord_rows, coord_cols = torch.meshgrid(row_array, col_array)
-            coords = torch.stack((coord_rows, coord_cols), dim=0).unsqueeze(0).repeat(points.size(0), 1, 1, 1)
+            coords_grid = self.get_coords_grid(rows, cols, points.device)
 
             add_xy = (points * self.spatial_scale).view(points.size(0), points.size(1), 1, 1)
-            coords.add_(-add_xy)
+            coords = coords_grid - add_xy.to(coords_grid.dtype)
             coords.div_(self.norm_radius * self.spatial_scale)
             coords.mul_(coords)
 
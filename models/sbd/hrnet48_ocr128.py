@@ -134,3 +134,4 @@ def train(model, cfg, model_cfg, start_epoch=0):
     for epoch in range(start_epoch, num_epochs):
         trainer.training(epoch)
         trainer.validation(epoch)
+    trainer.wait_for_checkpoints()
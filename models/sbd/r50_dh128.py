@@ -2,11 +2,10 @@ import random
 from functools import partial
 
 import torch
-from torchvision import transforms
 from easydict import EasyDict as edict
 from albumentations import (
     Compose, ShiftScaleRotate, PadIfNeeded, RandomCrop,
-    RGBShift, RandomBrightnessContrast, RandomRotate90, Flip
+    RandomRotate90, Flip
 )
 
 from isegm.engine.trainer import ISTrainer
@@ -15,6 +14,7 @@ from isegm.model.losses import SigmoidBinaryCrossEntropyLoss
 from isegm.model.metrics import AdaptiveIoU
 from isegm.data.sbd import SBDDataset
 from isegm.data.points_sampler import MultiPointSampler
+from isegm.data.transforms import BrightnessContrastRGBShift, FusedNormalize
 from isegm.utils.log import logger
 from isegm.model import initializer
 
@@ -33,11 +33,8 @@ def init_model(cfg):
     }
     model_cfg.num_max_points = 10
 
-    model_cfg.input_transform = transforms.Compose([
-        transforms.ToTensor(),
-        transforms.Normalize(model_cfg.input_normalization['mean'],
-                             model_cfg.input_normalization['std']),
-    ])
+    model_cfg.input_transform = FusedNormalize(model_cfg.input_normalization['mean'],
+                                               model_cfg.input_normalization['std'])
 
     model = get_deeplab_model(backbone='resnet50', deeplab_ch=128, aspp_dropout=0.20)
 
@@ -69,8 +66,10 @@ def train(model, cfg, model_cfg, start_epoch=0):
                          rotate_limit=(-3, 3), border_mode=0, p=0.75),
         PadIfNeeded(min_height=crop_size[0], min_width=crop_size[1], border_mode=0),
         RandomCrop(*crop_size),
-        RandomBrightnessContrast(brightness_limit=(-0.25, 0.25), contrast_limit=(-0.15, 0.4), p=0.75),
-        RGBShift(r_shift_limit=10, g_shift_limit=10, b_shift_limit=10, p=0.75)
+        BrightnessContrastRGBShift(brightness_limit=(-0.25, 0.25), contrast_limit=(-0.15, 0.4),
+                                   brightness_contrast_p=0.75,
+                                   r_shift_limit=10, g_shift_limit=10, b_shift_limit=10,
+                                   rgb_shift_p=0.75)
     ], p=1.0)
 
     val_augmentator = Compose([
@@ -131,3 +130,4 @@ def train(model, cfg, model_cfg, start_epoch=0):
     for epoch in range(start_epoch, num_epochs):
         trainer.training(epoch)
         trainer.validation(epoch)
+    trainer.wait_for_checkpoints()
@@ -4,7 +4,6 @@ import argparse
 from pathlib import Path
 
 import torch
-import numpy as np
 
 sys.path.insert(0, '.')
 from isegm.inference import utils
@@ -32,6 +31,10 @@ def parse_args():
                         help='ID of used GPU.')
     parser.add_argument('--cpu', action='store_true', default=False,
                         help='Use only CPU for inference.')
+    parser.add_argument('--amp', action='store_true', default=False,
+                        help='Run inference with automatic mixed precision (torch.cuda.amp). '
+                             'BRS modes give approximate results, since their optimization also runs in fp16. '
+                             'Results are saved with the "_amp" suffix. It is ignored when running on CPU.')
     parser.add_argument('--thresh', type=float, required=False, default=0.49,
                         help='The segmentation mask is obtained from the probability outputs using this threshold.')
     parser.add_argument('--target-iou', type=float, default=0.90,
@@ -48,6 +51,7 @@ def parse_args():
         args.device = torch.device('cpu')
     else:
         args.device = torch.device(f"cuda:{args.gpus.split(',')[0]}")
+    args.amp = args.amp and not args.cpu
     args.target_iou = max(0.8, args.target_iou)
 
     cfg = load_config_file(args.config_path, return_edict=True)
@@ -75,23 +79,27 @@ def main():
             args.clicks_limit = args.n_clicks
         predictor_params = {'net_clicks_limit': args.clicks_limit}
 
+    log_path = eval_exp_path / f'results_{args.mode}_{args.n_clicks}.txt'
+
     print_header = True
-    for dataset_name in args.datasets.split(','):
-        dataset = utils.get_dataset(dataset_name, cfg)
+    with open(log_path, 'a') as log_file:
+        for dataset_name in args.datasets.split(','):
+            dataset = utils.get_dataset(dataset_name, cfg)
 
-        zoom_in_target_size = 600 if dataset_name == 'DAVIS' else 400
-        predictor = get_predictor(model, args.mode, args.device,
-                                  prob_thresh=args.thresh,
-                                  zoom_in_params={'target_size': zoom_in_target_size},
-                                  predictor_params=predictor_params)
+            zoom_in_target_size = 600 if dataset_name == 'DAVIS' else 400
+            predictor = get_predictor(model, args.mode, args.device,
+                                      prob_thresh=args.thresh,
+                                      zoom_in_params={'target_size': zoom_in_target_size},
+                                      predictor_params=predictor_params)
 
-        dataset_results = evaluate_dataset(dataset, predictor, pred_thr=args.thresh,
-                                           max_iou_thr=args.target_iou,
-                                           max_clicks=args.n_clicks)
+            with torch.cuda.amp.autocast(enabled=args.amp):
+                dataset_results = evaluate_dataset(dataset, predictor, pred_thr=args.thresh,
+                                                   max_iou_thr=args.target_iou,
+                                                   max_clicks=args.n_clicks)
 
-        save_results(args, dataset_name, eval_exp_path, dataset_results,
-                     print_header=print_header)
-        print_header = False
+            save_results(args, dataset_name, eval_exp_path, dataset_results, log_file,
+                         print_header=print_header)
+            print_header = False
 
 
 def get_eval_exp_name(args):
@@ -99,44 +107,47 @@ def get_eval_exp_name(args):
         model_name, checkpoint_prefix = args.checkpoint.split(':')
         model_name = model_name.split('/')[-1]
 
-        return f"{model_name}_{checkpoint_prefix}"
+        eval_exp_name = f"{model_name}_{checkpoint_prefix}"
     else:
-        return Path(args.checkpoint).stem
+        eval_exp_name = Path(args.checkpoint).stem
+
+    if args.amp:
+        eval_exp_name += '_amp'
 
+    return eval_exp_name
 
-def save_results(args, dataset_name, eval_exp_path, dataset_results, print_header=True):
+
+def save_results(args, dataset_name, eval_exp_path, dataset_results, log_file, print_header=True):
     all_ious, elapsed_time = dataset_results
     mean_spc, mean_spi = utils.get_time_metrics(all_ious, elapsed_time)
 
-    iou_thrs = np.arange(0.8, min(0.95, args.target_iou) + 0.001, 0.05).tolist()
-    noc_list, over_max_list = utils.compute_noc_metric(all_ious, iou_thrs=iou_thrs, max_clicks=args.n_clicks)
-    header, table_row = utils.get_results_table(noc_list, over_max_list, args.mode, dataset_name,
+    iou_thrs = [iou_thr for iou_thr in (0.80, 0.85, 0.90) if iou_thr <= args.target_iou + 1e-6]
+    target_iou_int = int(args.target_iou * 100)
+    with_target_iou = target_iou_int not in [80, 85, 90]
+    all_iou_thrs = iou_thrs + [args.target_iou] if with_target_iou else iou_thrs
+
+    noc_list, over_max_list = utils.compute_noc_metric(all_ious, iou_thrs=all_iou_thrs, max_clicks=args.n_clicks)
+    header, table_row = utils.get_results_table(noc_list[:len(iou_thrs)], over_max_list[:len(iou_thrs)],
+                                                args.mode, dataset_name,
                                                 mean_spc, elapsed_time, args.n_clicks,
                                                 model_name=eval_exp_path.stem)
-    target_iou_int = int(args.target_iou * 100)
-    if target_iou_int not in [80, 85, 90]:
-        noc_list, over_max_list = utils.compute_noc_metric(all_ious, iou_thrs=[args.target_iou],
-                                                           max_clicks=args.n_clicks)
-        table_row += f' NoC@{args.target_iou:.1%} = {noc_list[0]:.2f};'
-        table_row += f' >={args.n_clicks}@{args.target_iou:.1%} = {over_max_list[0]}'
+    if with_target_iou:
+        table_row += f' NoC@{args.target_iou:.1%} = {noc_list[-1]:.2f};'
+        table_row += f' >={args.n_clicks}@{args.target_iou:.1%} = {over_max_list[-1]}'
 
     if print_header:
         print(header)
     print(table_row)
 
-    log_path = eval_exp_path / f'results_{args.mode}_{args.n_clicks}.txt'
-    if log_path.exists():
-        with open(log_path, 'a') as f:
-            f.write(table_row + '\n')
-    else:
-        with open(log_path, 'w') as f:
-            f.write(header + '\n')
-            f.write(table_row + '\n')
+    if log_file.tell() == 0:
+        log_file.write(header + '\n')
+    log_file.write(table_row + '\n')
+    log_file.flush()
 
     ious_path = eval_exp_path / 'all_ious'
     ious_path.mkdir(exist_ok=True)
     with open(ious_path / f'{dataset_name}_{args.mode}_{args.n_clicks}.pkl', 'wb') as fp:
-        pickle.dump(all_ious, fp)
+        pickle.dump(all_ious, fp, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 if __name__ == '__main__':
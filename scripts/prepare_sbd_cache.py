@@ -0,0 +1,55 @@
+import sys
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+from scipy.io import loadmat
+
+sys.path.insert(0, '.')
+from isegm.utils.exp import load_config_file
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dataset-path', type=str, default='',
+                        help='The path to the SBD dataset. Default path: cfg.SBD_PATH.')
+    parser.add_argument('--config-path', type=str, default='./config.yml',
+                        help='The path to the config file.')
+
+    args = parser.parse_args()
+    if args.dataset_path == '':
+        cfg = load_config_file(args.config_path, return_edict=True)
+        args.dataset_path = cfg.SBD_PATH
+    args.dataset_path = Path(args.dataset_path)
+
+    return args
+
+
+def main():
+    args = parse_args()
+
+    insts_path = args.dataset_path / 'inst'
+    cache_path = args.dataset_path / 'inst_png'
+    cache_path.mkdir(exist_ok=True)
+
+    for split in ['train', 'val']:
+        with open(args.dataset_path / f'{split}.txt', 'r') as f:
+            samples = [x.strip() for x in f.readlines()]
+
+        for sample in tqdm(samples, desc=split):
+            mask_path = cache_path / f'{sample}.png'
+            if mask_path.exists():
+                continue
+
+            instances_mask = loadmat(str(insts_path / f'{sample}.mat'))['GTinst'][0][0][0]
+            assert instances_mask.min() >= 0 and instances_mask.max() < 2 ** 16
+            mask_dtype = np.uint8 if instances_mask.max() < 2 ** 8 else np.uint16
+            cv2.imwrite(str(mask_path), instances_mask.astype(mask_dtype))
+
+    print(f'Instance masks are saved to {cache_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
+import os
 import argparse
 import importlib.util
 
+import cv2
 import torch
 from isegm.utils.exp import init_experiment
 
@@ -13,6 +15,8 @@ def main():
 
     torch.backends.cudnn.benchmark = True
     torch.multiprocessing.set_sharing_strategy('file_system')
+    cv2.setNumThreads(0)
+    cv2.ocl.setUseOpenCL(False)
     model_script.main(cfg)
 
 
@@ -26,8 +30,11 @@ def parse_args():
                         help='Here you can specify the name of the experiment. '
                              'It will be added as a suffix to the experiment folder.')
 
-    parser.add_argument('--workers', type=int, default=4,
-                        metavar='N', help='Dataloader threads.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        metavar='N', help='Dataloader threads. By default, the number of CPUs.')
+
+    parser.add_argument('--no-prefetch', dest='use_prefetch', action='store_false',
+                        help='Disable copying the next batch to the GPU on a separate CUDA stream.')
 
     parser.add_argument('--batch-size', type=int, default=-1,
                         help='You can override model batch size by specify positive number.')